@@ -7,7 +7,6 @@
 
 
 import argparse
-import yfinance as yf
 import sys
 
 def main():
@@ -21,6 +20,9 @@ def main():
     ticker = args.ticker
     period = args.period
 
+    # Imported here so `--help` and argument errors don't pay for loading yfinance/pandas
+    import yfinance as yf
+
     # Fetch data
     print(f"Fetching data for {ticker}, period={period}...")
     try:
@@ -33,11 +35,11 @@ def main():
         print("No data returned. Check your ticker or period.")
         sys.exit(1)
 
-    # Compute summary
-    start_price = df["Close"].iloc[0]
-    end_price = df["Close"].iloc[-1]
+    # Compute summary (index the raw ndarray rather than going through .iloc)
+    close = df["Close"].values
+    start_price, end_price = close[0], close[-1]
     change = end_price - start_price
-    pct_change = (change / start_price) * 100
+    pct_change = change / start_price * 100
 
     print(f"Start Price: ${start_price:.2f}")
     print(f"End Price:   ${end_price:.2f}")
@@ -7,6 +7,9 @@
 # %matplotlib inline
 # to display plots inline in the notebook. (We'll omit that here for script form.)
 
+import io
+
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import yfinance as yf
@@ -19,11 +22,24 @@ df = ticker.history(period="3y")
 print("Dataframe head:")
 print(df.head(), "\n")
 
-print("Dataframe info:")
-print(df.info(), "\n")
-
-# 3) Compute daily returns
-df["Daily Return"] = df["Close"].pct_change()
+# df.info() walks every column, so it only runs when asked for; when it does, it renders
+# into a string once (shallow memory usage, no per-string sizing) and prints that
+SHOW_INFO = False
+
+print("Dataframe dtypes:")
+print(df.dtypes, "\n")
+if SHOW_INFO:
+    buf = io.StringIO()
+    df.info(buf=buf, memory_usage=True)
+    print("Dataframe info:")
+    print(buf.getvalue())
+
+# 3) Compute daily log returns (continuously compounded) in one NumPy pass
+close = df["Close"].to_numpy(dtype=np.float64)
+logret = np.empty_like(close)
+logret[0] = np.nan
+np.subtract(np.log(close[1:]), np.log(close[:-1]), out=logret[1:])
+df["LogReturn"] = logret
 
 # 4) Plot the Close price
 plt.figure(figsize=(10, 4))
@@ -34,11 +50,11 @@ plt.ylabel("Price (USD)")
 plt.legend()
 plt.show()
 
-# 5) Quick stats on daily returns
-mean_return = df["Daily Return"].mean()
-volatility = df["Daily Return"].std()
-print(f"Mean daily return: {mean_return:.4%}")
-print(f"Volatility (std dev) : {volatility:.4%}")
+# 5) Quick stats on daily log returns (volatility annualized over 252 trading days)
+mean_return = logret[1:].mean()
+volatility = logret[1:].std(ddof=1) * np.sqrt(252)
+print(f"Mean daily log return: {mean_return:.4%}")
+print(f"Annualized volatility: {volatility:.4%}")
 
 # Typical usage in a Notebook:
 # - Additional cells might explore correlation with macro data,
@@ -4,8 +4,11 @@ advanced_finance_dashboard.py
 
 A multi-tab financial dashboard that:
   - Tab 1 (Dashboard):
-      • Fetches and plots stock data (with 50- and 200-day moving averages).
+      • Fetches and plots stock data (with 50- and 200-day moving averages
+        and 90-day annualized volatility).
       • Displays stock performance (start/end prices + absolute/percentage change).
+      • Accepts a comma/space separated watchlist: the first ticker is charted, the others
+        are shown as period % change, and all are downloaded in one batched request.
       • Displays macroeconomic indicators as a range from the stock's start date
         (or a custom Macro Date) to the current date, including:
           - Fed Funds Rate
@@ -21,16 +24,21 @@ A multi-tab financial dashboard that:
     an auto-refresh option with a configurable interval.
 
 Requires:
-    pip install yfinance pandas-datareader wbdata matplotlib pandas
+    pip install yfinance "httpx[http2]" matplotlib pandas pyarrow
 """
 
 import tkinter as tk
 from tkinter import ttk, messagebox
 import datetime
+import functools
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import httpx
 import pandas as pd
 import yfinance as yf
-from pandas_datareader import data as pdr
-import wbdata
 import matplotlib
 
 matplotlib.use("TkAgg")  # Use TkAgg for embedding in tkinter
@@ -47,78 +55,111 @@ def set_status(message):
 # ------------------------------------------------------------------------------------
 # Helper Functions for FRED
 # ------------------------------------------------------------------------------------
+# Series shown as a Macro Date -> Today range (value at each end of the range)
+FRED_RANGE_SERIES = ("FEDFUNDS", "UNRATE", "DGS1", "DGS5", "DGS10", "DGS30", "PAYEMS", "HOUST")
+
+FRED_CSV_URL = "https://fred.stlouisfed.org/graph/fredgraph.csv"
+WORLD_BANK_GDP_URL = "https://api.worldbank.org/v2/country/US/indicator/NY.GDP.MKTP.CD"
+
+# One HTTP/2 client shared by the FRED and World Bank fetches: concurrent requests to the
+# same host are multiplexed over a single connection instead of each paying a TLS handshake.
+# Closed once the main loop exits.
+_HTTP = httpx.Client(http2=True, timeout=10.0, limits=httpx.Limits(max_keepalive_connections=20))
+
+def _fred_fetch(series_id, start, end):
+    """
+    Downloads one FRED series between start and end from the fredgraph CSV endpoint.
+    Returns a single-column DataFrame indexed by date (missing observations dropped).
+    """
+    params = {"id": series_id, "cosd": start.strftime("%Y-%m-%d"), "coed": end.strftime("%Y-%m-%d")}
+    resp = _HTTP.get(FRED_CSV_URL, params=params)
+    resp.raise_for_status()
+    data = pd.read_csv(io.StringIO(resp.text), index_col=0, parse_dates=True, na_values=".")
+    return data.dropna()
+
+def _last_pos_on_or_before(data, target_date):
+    """
+    Binary-searches the (sorted) date index for the last row on or before target_date.
+    Returns its position, or -1 if there is none. Avoids slicing a frame just to read one row.
+    """
+    return data.index.searchsorted(pd.Timestamp(target_date), side="right") - 1
+
 def get_fred_value(series_id, target_date, window=30):
     """
     Fetches a FRED series for a window around target_date,
-    returns the last value on or before target_date and its date.
+    returns the last value on or before target_date and its date (a Timestamp;
+    formatting is left to the UI).
     """
     start = target_date - datetime.timedelta(days=window)
     end = target_date + datetime.timedelta(days=window)
-    data = pdr.get_data_fred(series_id, start=start, end=end)
-    if data.empty:
+    data = _fred_fetch(series_id, start, end)
+    pos = _last_pos_on_or_before(data, target_date)
+    if pos < 0:
         return None, None
-    subset = data.loc[:target_date]
-    if subset.empty:
-        return None, None
-    value = subset.iloc[-1, 0]
-    date_str = subset.index[-1].strftime("%Y-%m-%d")
-    return round(value, 2), date_str
+    return round(data.iat[pos, 0], 2), data.index[pos]
 
-def get_fred_range(series_id, start_date, end_date, window=30):
+def _yoy_inflation(data, target_date):
     """
-    Returns a tuple:
-      (val_start, date_start, val_end, date_end)
-    for the given FRED series, representing the value at start_date
-    and the value at end_date (with a window).
+    Computes YoY inflation at target_date from an already-downloaded CPIAUCSL frame,
+    returning (inflation_percent, date) with date as a Timestamp.
     """
-    v_start, d_start = get_fred_value(series_id, start_date, window)
-    v_end, d_end = get_fred_value(series_id, end_date, window)
-    return v_start, d_start, v_end, d_end
+    current_pos = _last_pos_on_or_before(data, target_date)
+    prev_pos = _last_pos_on_or_before(data, target_date - datetime.timedelta(days=365))
+    if current_pos < 0 or prev_pos < 0:
+        return None, None
+    current_value = data.iat[current_pos, 0]
+    current_date = data.index[current_pos]
+    previous_value = data.iat[prev_pos, 0]
+    inflation = ((current_value - previous_value) / previous_value) * 100
+    return round(inflation, 2), current_date
 
-def get_inflation_value(target_date):
+def get_inflation_pair(start_date, end_date):
     """
-    Computes YoY inflation from the CPIAUCSL series (CPI),
-    returning (inflation_percent, date_str).
+    Returns (infl_start, date_start, infl_end, date_end), representing inflation at
+    start_date and end_date, computed from a single CPIAUCSL download covering both.
     """
-    start = target_date - datetime.timedelta(days=400)
-    end = target_date + datetime.timedelta(days=30)
-    data = pdr.get_data_fred("CPIAUCSL", start=start, end=end)
+    start = start_date - datetime.timedelta(days=400)
+    end = end_date + datetime.timedelta(days=30)
+    data = _fred_fetch("CPIAUCSL", start, end)
     if data.empty:
-        return None, None
-    current_subset = data.loc[:target_date]
-    if current_subset.empty:
-        return None, None
-    current_value = current_subset.iloc[-1, 0]
-    current_date = current_subset.index[-1]
-    prev_date = target_date - datetime.timedelta(days=365)
-    prev_subset = data.loc[:prev_date]
-    if prev_subset.empty:
-        return None, None
-    previous_value = prev_subset.iloc[-1, 0]
-    inflation = ((current_value - previous_value) / previous_value) * 100
-    return round(inflation, 2), current_date.strftime("%Y-%m-%d")
+        return None, None, None, None
+    return _yoy_inflation(data, start_date) + _yoy_inflation(data, end_date)
+
+# World Bank GDP is annual, so the downloaded history is reused until the year rolls over
+_GDP_CACHE = {}
 
-def get_inflation_range(start_date, end_date):
+def _load_gdp_df():
     """
-    Returns (infl_start, date_start, infl_end, date_end),
-    representing inflation at start_date and end_date.
+    Returns the US GDP history from the World Bank JSON API (indexed by year, oldest first),
+    downloading it at most once per calendar year. Returns None if no usable data.
     """
-    s_val, s_dt = get_inflation_value(start_date)
-    e_val, e_dt = get_inflation_value(end_date)
-    return s_val, s_dt, e_val, e_dt
+    year = datetime.date.today().year
+    if year in _GDP_CACHE:
+        return _GDP_CACHE[year]
+    resp = _HTTP.get(WORLD_BANK_GDP_URL, params={"format": "json", "per_page": 100})
+    resp.raise_for_status()
+    payload = resp.json()  # [paging metadata, [observations...]]
+    rows = payload[1] if len(payload) > 1 and payload[1] else []
+    records = [(row["date"], row["value"]) for row in rows if row["value"] is not None]
+    if not records:
+        return None
+    gdp_data = pd.DataFrame.from_records(records, columns=["year", "GDP"]).set_index("year")
+    try:
+        gdp_data.index = pd.to_datetime(gdp_data.index, format="%Y")
+    except Exception:
+        return None
+    gdp_data = gdp_data.sort_index()  # The API lists newest first
+    _GDP_CACHE.clear()
+    _GDP_CACHE[year] = gdp_data
+    return gdp_data
 
 def get_gdp_value(target_date):
     """
     Fetches US GDP data from the World Bank, returning (gdp_in_trillions, year).
     gdp_in_trillions is the data on or before target_date.
     """
-    indicators = {"NY.GDP.MKTP.CD": "GDP"}
-    gdp_data = wbdata.get_dataframe(indicators, country="US")
-    if gdp_data.empty:
-        return None, None
-    try:
-        gdp_data.index = pd.to_datetime(gdp_data.index, format="%Y")
-    except Exception:
+    gdp_data = _load_gdp_df()
+    if gdp_data is None:
         return None, None
     subset = gdp_data[gdp_data.index <= target_date]
     if subset.empty:
@@ -130,34 +171,245 @@ def get_gdp_value(target_date):
 # ------------------------------------------------------------------------------------
 # Stock Data Functions
 # ------------------------------------------------------------------------------------
+# Shared worker pool for network fetches
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Fetches currently running, keyed by (op, ticker, period, macro_date). A second
+# identical request (auto-refresh racing a click) rides on the first instead.
+_IN_FLIGHT = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
+def _submit(fn, *args, on_done=None):
+    """
+    Runs fn(*args) on the worker pool so network IO never blocks the Tk main loop.
+    When it finishes, on_done(future) is scheduled on the Tk main thread via root.after,
+    since widgets may only be touched from there. Returns the Future.
+    """
+    future = _EXECUTOR.submit(fn, *args)
+    if on_done is not None:
+        future.add_done_callback(lambda fut: root.after(0, on_done, fut))
+    return future
+
+@functools.lru_cache(maxsize=32)
+def get_ticker(symbol):
+    """Returns a shared yf.Ticker per symbol so repeat fetches reuse its session and caches."""
+    return yf.Ticker(symbol)
+
+# Local price-history cache: bars before today never change, so a Fetch only
+# downloads the tail since the last cached bar.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".mccookbook_cache")
+
+# How far back each time period reaches from the latest bar ("ytd"/"max" handled separately)
+PERIOD_OFFSETS = {
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+    "5y": pd.DateOffset(years=5),
+}
+
+def _cache_path(ticker, period):
+    return os.path.join(CACHE_DIR, f"{ticker}_{period}.parquet")
+
+def load_cached(ticker, period):
+    """Returns the cached price history for (ticker, period), or None if there is none."""
+    path = _cache_path(ticker, period)
+    if not os.path.exists(path):
+        return None
+    try:
+        return pd.read_parquet(path, engine="pyarrow")
+    except Exception:
+        return None  # Unreadable cache is treated as a miss
+
+def _store_cached(ticker, period, data):
+    """Writes the history to the cache via a temp file + rename, so readers never see a partial file."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _cache_path(ticker, period)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    data.to_parquet(tmp_path, engine="pyarrow")
+    os.replace(tmp_path, path)
+
+def _trim_to_period(data, period):
+    """Drops bars that have fallen out of 'period' (measured back from the latest bar)."""
+    if period == "max":
+        return data
+    latest = data.index[-1]
+    if period == "ytd":
+        return data[data.index.year == latest.year]
+    return data[data.index > latest - PERIOD_OFFSETS[period]]
+
+def parse_symbols(text):
+    """Splits the ticker entry on commas/whitespace into unique upper-case symbols (order kept)."""
+    symbols = []
+    for symbol in text.replace(",", " ").split():
+        symbol = symbol.upper()
+        if symbol not in symbols:
+            symbols.append(symbol)
+    return symbols
+
+def _download(symbols, **kwargs):
+    """
+    One batched yf.download for all 'symbols' (yfinance threads the requests internally).
+    Returns {symbol: DataFrame}; a symbol with no data maps to an empty DataFrame.
+    """
+    raw = yf.download(symbols, group_by="ticker", threads=True, auto_adjust=False, progress=False, **kwargs)
+    frames = {}
+    for symbol in symbols:
+        if isinstance(raw.columns, pd.MultiIndex):
+            frame = raw[symbol] if symbol in raw.columns.get_level_values(0) else pd.DataFrame()
+        else:
+            frame = raw  # Older yfinance returns flat columns for a single symbol
+        frames[symbol] = frame.dropna(how="all")
+    return frames
+
+def fetch_histories(symbols, period):
+    """
+    Returns {symbol: price history for 'period'} using at most two batched downloads:
+    one tail download (from the oldest last-completed cached bar onward) that is appended to
+    each cached history, and one full download for symbols with no usable cache.
+    """
+    cached = {symbol: load_cached(symbol, period) for symbol in symbols}
+    # Caches written before the switch to yf.download lack "Adj Close"; refetch those in full
+    warm = [s for s in symbols if cached[s] is not None and not cached[s].empty
+            and "Adj Close" in cached[s].columns]
+    cold = [s for s in symbols if s not in warm]
+
+    histories = {}
+    if warm:
+        # Re-download from the last *completed* cached bar (the very last one may have been an
+        # intraday bar). That bar's prices are final, so if they no longer match the cache,
+        # Yahoo has rescaled the history for a split or dividend and the cache must be refetched.
+        refs = {s: cached[s].index[-2] if len(cached[s]) > 1 else cached[s].index[-1] for s in warm}
+        start = min(refs.values()).date()
+        tails = _download(warm, start=start)
+        for symbol in warm:
+            old, ref, tail = cached[symbol], refs[symbol], tails[symbol]
+            tail = tail[tail.index >= ref]
+            # A missing reference bar (including an empty tail, which is how yf.download
+            # reports network/Yahoo errors) also means a full refetch rather than stale data
+            if ref not in tail.index or not np.allclose(
+                    tail.loc[ref, ["Close", "Adj Close"]].to_numpy(dtype=np.float64),
+                    old.loc[ref, ["Close", "Adj Close"]].to_numpy(dtype=np.float64),
+                    rtol=1e-4, equal_nan=True):
+                cold.append(symbol)
+            else:
+                data = pd.concat([old[old.index < tail.index[0]], tail])
+                histories[symbol] = _trim_to_period(data, period)
+    if cold:
+        histories.update(_download(cold, period=period))
+
+    for symbol, data in histories.items():
+        if not data.empty:
+            try:
+                _store_cached(symbol, period, data)
+            except Exception:
+                pass  # The cache is best-effort; a failed write just means a full fetch next time
+    return histories
+
+def rolling_means(values, windows):
+    """
+    Returns trailing simple moving averages of 'values', one array per window in 'windows'.
+    All windows share a single cumulative-sum pass, so the cost is O(n) regardless of window
+    size. Like pandas' rolling(window).mean(), a position is NaN unless its full window is valid.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    valid = np.isfinite(values)
+    csum = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+    ccount = np.concatenate(([0], np.cumsum(valid)))
+    means = []
+    for w in windows:
+        ma = np.full(values.shape, np.nan)
+        if len(values) >= w:
+            ma[w - 1:] = (csum[w:] - csum[:-w]) / w
+            ma[w - 1:][(ccount[w:] - ccount[:-w]) < w] = np.nan
+        means.append(ma)
+    return means
+
+def rolling_std(values, window):
+    """
+    Returns the trailing sample standard deviation of 'values' over 'window' points.
+    Keeps running sums of x and x^2 (the value leaving the window is subtracted), so the
+    cost is O(n) instead of pandas' O(n * window). Values are centred on their mean first,
+    which keeps the x^2 sums small and avoids cancellation. As in rolling_means, a NaN or
+    infinite value only invalidates the windows that contain it; positions before a full
+    window are NaN.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    std = np.full(values.shape, np.nan)
+    if len(values) < window:
+        return std
+    valid = np.isfinite(values)
+    if not valid.any():
+        return std
+    centred = np.where(valid, values - values[valid].mean(), 0.0)
+    csum = np.concatenate(([0.0], np.cumsum(centred)))
+    csum_sq = np.concatenate(([0.0], np.cumsum(centred * centred)))
+    ccount = np.concatenate(([0], np.cumsum(valid)))
+    win_sum = csum[window:] - csum[:-window]
+    win_sum_sq = csum_sq[window:] - csum_sq[:-window]
+    var = (win_sum_sq - win_sum * win_sum / window) / (window - 1)
+    std[window - 1:] = np.sqrt(np.maximum(var, 0.0))  # Clamp tiny negative rounding error
+    std[window - 1:][(ccount[window:] - ccount[:-window]) < window] = np.nan
+    return std
+
 def update_all_data():
     """
     Single entry-point to refresh:
       1) Stock data & chart
       2) Macro data (range from stock start date or custom Macro Date to current date)
       3) Ticker info
+    Returns the stock fetch's Future (None if there was nothing to fetch).
     """
-    update_stock_data()  # This also calls update_macro_data() and update_ticker_info()
+    return update_stock_data()  # This also calls update_macro_data() and update_ticker_info()
 
 def update_stock_data():
-    """Fetches stock data, updates chart & performance, sets Macro Date if empty, calls macro & ticker updates."""
-    ticker = ticker_entry.get().strip()
+    """
+    Fetches stock data on a worker thread, then updates chart & performance, sets Macro Date
+    if empty, and calls macro & ticker updates. Returns the fetch's Future (shared with an
+    identical fetch already in flight), or None if the input is invalid.
+    """
+    symbols = parse_symbols(ticker_entry.get())
     period = period_var.get()
 
-    if not ticker:
+    if not symbols:
         messagebox.showwarning("Input Error", "Please enter a valid stock ticker.")
         return
 
-    set_status(f"Loading stock data for {ticker} (Period: {period})...")
-    root.update_idletasks()
+    key = ("stock", tuple(symbols), period, macro_date_entry.get().strip())
+    with _IN_FLIGHT_LOCK:
+        if key in _IN_FLIGHT:
+            return _IN_FLIGHT[key]  # Already running; its result will land in the UI
+        future = _submit(_fetch_stock_data, symbols, period,
+                         on_done=lambda fut: _apply_stock_data(symbols, period, fut))
+        _IN_FLIGHT[key] = future
+
+    set_status(f"Loading stock data for {', '.join(symbols)} (Period: {period})...")
 
+    def release(_fut):
+        with _IN_FLIGHT_LOCK:
+            _IN_FLIGHT.pop(key, None)
+
+    future.add_done_callback(release)
+    return future
+
+def _fetch_stock_data(symbols, period):
+    """Worker-thread half of update_stock_data: network IO only, no widget access."""
+    return get_ticker(symbols[0]), fetch_histories(symbols, period)
+
+def _apply_stock_data(symbols, period, future):
+    """
+    Main-thread half of update_stock_data. The first symbol drives the chart, performance,
+    Macro Date and Ticker Info; any others are summarized in the watchlist row.
+    """
     try:
-        data = yf.Ticker(ticker).history(period=period)
+        tkr, histories = future.result()
     except Exception as e:
         set_status("Error loading stock data.")
         messagebox.showerror("Data Fetch Error", f"Failed to download stock data:\n{e}")
         return
 
+    ticker = symbols[0]
+    data = histories[ticker]
     if data.empty:
         set_status("No data found.")
         messagebox.showinfo("No Data", f"No stock data found for '{ticker}' with period '{period}'.")
@@ -165,50 +417,79 @@ def update_stock_data():
 
     price_col = "Adj Close" if "Adj Close" in data.columns else "Close"
 
-    # Calculate moving averages
-    data["MA50"] = data[price_col].rolling(window=50).mean()
-    data["MA200"] = data[price_col].rolling(window=200).mean()
-
-    # Update chart
-    ax_stock.clear()
-    ax_stock.plot(data.index, data[price_col], label=price_col, color="blue")
-    ax_stock.plot(data.index, data["MA50"], label="50-Day MA", color="orange")
-    ax_stock.plot(data.index, data["MA200"], label="200-Day MA", color="green")
+    # Work on plain ndarrays from here on; pandas accessors cost far more per call
+    prices = data[price_col].to_numpy(copy=False)
+    dates = data.index.to_numpy()
+
+    # Calculate moving averages (both from one cumulative-sum pass)
+    ma50, ma200 = rolling_means(prices, (50, 200))
+
+    # 90-day rolling volatility of daily log returns, annualized (aligned to the price index)
+    log_returns = np.log(prices[1:] / prices[:-1])
+    vol90 = np.concatenate(([np.nan], rolling_std(log_returns, 90) * np.sqrt(252)))
+
+    # Long periods have far more bars than the canvas has pixels; plot about two points
+    # per pixel (the MAs were computed on the full series, so only drawing is affected)
+    n_pts = canvas_stock.get_tk_widget().winfo_width()
+    if n_pts <= 1:  # Widget not mapped yet; fall back to the figure's own width
+        n_pts = int(fig_stock.bbox.width)
+    stride = max(1, len(prices) // (2 * n_pts))
+    plot_dates = dates[::stride]
+
+    # Update chart: swap the data on the persistent lines instead of rebuilding the axes
+    line_price.set_data(plot_dates, prices[::stride])
+    line_ma50.set_data(plot_dates, ma50[::stride])
+    line_ma200.set_data(plot_dates, ma200[::stride])
+    line_vol.set_data(plot_dates, vol90[::stride])
+    line_price.set_label(price_col)
+    stock_legend.get_texts()[0].set_text(price_col)
     ax_stock.set_title(f"{ticker} Price Over {period}")
-    ax_stock.set_xlabel("Date")
-    ax_stock.set_ylabel("Price (USD)")
-    ax_stock.legend()
-    ax_stock.grid(True)
-    canvas_stock.draw()
+    for ax in (ax_stock, ax_vol):
+        ax.relim()
+        ax.autoscale_view()
+    canvas_stock.draw_idle()
 
     # Stock performance info
-    start_price = data[price_col].iloc[0]
-    end_price = data[price_col].iloc[-1]
+    start_price, end_price = prices[0], prices[-1]
     price_change = end_price - start_price
     pct_change = (price_change / start_price) * 100
 
     stock_start_label_value.config(text=f"${start_price:.2f}")
     stock_end_label_value.config(text=f"${end_price:.2f}")
     stock_change_label_value.config(text=f"${price_change:.2f} ({pct_change:.2f}%)")
-    last_update_label.config(text=f"Last Updated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+    # Watchlist: period change for every other symbol
+    watchlist = []
+    for symbol in symbols[1:]:
+        other = histories[symbol]
+        if other.empty:
+            watchlist.append(f"{symbol}: N/A")
+            continue
+        other_prices = other["Adj Close" if "Adj Close" in other.columns else "Close"].to_numpy(copy=False)
+        watchlist.append(f"{symbol}: {(other_prices[-1] / other_prices[0] - 1) * 100:+.2f}%")
+    watchlist_label_value.config(text="   ".join(watchlist) if watchlist else "N/A")
+    now = datetime.datetime.now().replace(microsecond=0)
+    last_update_label.config(text=f"Last Updated: {now.isoformat(' ')}")
 
     # Update Macro Date if none is provided
-    stock_start_date_str = data.index[0].strftime("%Y-%m-%d")
+    stock_start_date_str = data.index[0].isoformat()[:10]
     if not macro_date_entry.get().strip():
         macro_date_entry.delete(0, tk.END)
         macro_date_entry.insert(0, stock_start_date_str)
 
-    # Now fetch macro data
+    # Now fetch macro data and ticker info (same Ticker object, so no second lookup);
+    # both run on the worker pool. Ticker info always refetches and sets "Fetch complete."
+    # when it lands, so the status settles even when the macro fetch is skipped.
     update_macro_data()
+    update_ticker_info(tkr)
 
-    # Also update ticker info
-    update_ticker_info()
-
-    set_status("Fetch complete.")
+# (macro_date, today) of the last successful macro fetch. FRED series update at most daily
+# and GDP annually, so auto-refresh ticks only refetch when one of the two changes.
+_LAST_MACRO_KEY = None
 
 def update_macro_data():
     """
-    Fetches macro data (range: Macro Date -> Today) for:
+    Fetches macro data (range: Macro Date -> Today) on a worker thread for:
       - Fed Funds Rate
       - Unemployment
       - Treasury Yields (1,5,10,30)
@@ -216,14 +497,17 @@ def update_macro_data():
       - Housing Starts (HOUST)
       - YoY Inflation
       - US GDP (most recent)
+    Skips the fetch when the last one was for the same Macro Date and day, unless
+    "Force Refresh" is checked. Returns the fetch's Future, or None if nothing was fetched.
     """
     macro_date_str = macro_date_entry.get().strip()
     if not macro_date_str:
         return  # Skip if still empty
 
-    # Show status
-    set_status("Loading macro data from FRED & World Bank...")
-    root.update_idletasks()
+    key = (macro_date_str, datetime.date.today().isoformat())
+    if key == _LAST_MACRO_KEY and not force_refresh_var.get():
+        set_status("Fetch complete.")  # Macro labels are already current
+        return
 
     try:
         start_date = datetime.datetime.strptime(macro_date_str, "%Y-%m-%d")
@@ -234,90 +518,130 @@ def update_macro_data():
 
     end_date = datetime.datetime.today()
 
-    try:
-        # Fed Funds Rate
-        fed_s, fed_sd, fed_e, fed_ed = get_fred_range("FEDFUNDS", start_date, end_date, window=30)
-        # Unemployment
-        unemp_s, unemp_sd, unemp_e, unemp_ed = get_fred_range("UNRATE", start_date, end_date, window=30)
-        # Inflation (YoY)
-        infl_s, infl_sd = get_inflation_value(start_date)
-        infl_e, infl_ed = get_inflation_value(end_date)
-
-        # US Treasury Yields
-        bond1_s, bond1_sd, bond1_e, bond1_ed = get_fred_range("DGS1", start_date, end_date, window=30)
-        bond5_s, bond5_sd, bond5_e, bond5_ed = get_fred_range("DGS5", start_date, end_date, window=30)
-        bond10_s, bond10_sd, bond10_e, bond10_ed = get_fred_range("DGS10", start_date, end_date, window=30)
-        bond30_s, bond30_sd, bond30_e, bond30_ed = get_fred_range("DGS30", start_date, end_date, window=30)
-
-        # Nonfarm Payrolls (in thousands)
-        nf_s, nf_sd, nf_e, nf_ed = get_fred_range("PAYEMS", start_date, end_date, window=30)
-        # Housing Starts (in thousands)
-        hs_s, hs_sd, hs_e, hs_ed = get_fred_range("HOUST", start_date, end_date, window=30)
+    # Show status
+    set_status("Loading macro data from FRED & World Bank...")
+    return _submit(fetch_macro_data, start_date, end_date, on_done=lambda fut: _apply_macro_data(key, fut))
 
+def fetch_macro_data(start_date, end_date):
+    """
+    Runs every FRED / World Bank lookup for the range and returns a dict of
+    (val_start, date_start, val_end, date_end) per FRED series plus "INFLATION",
+    and (gdp_in_trillions, year) under "GDP". Network IO only, no widget access.
+    """
+    # Every lookup is an independent, IO-bound HTTP round-trip, so submit each
+    # end of every range as its own job: total latency is roughly the slowest
+    # single request, not the sum.
+    with ThreadPoolExecutor(max_workers=20) as ex:
+        starts = {s: ex.submit(get_fred_value, s, start_date, 30) for s in FRED_RANGE_SERIES}
+        ends = {s: ex.submit(get_fred_value, s, end_date, 30) for s in FRED_RANGE_SERIES}
+        # Inflation (YoY), both ends from one CPI download
+        infl_job = ex.submit(get_inflation_pair, start_date, end_date)
         # US GDP (just current)
-        gdp_val, gdp_year = get_gdp_value(end_date)
-
-        # Format to show range
-        if fed_s is not None:
-            interest_label_value.config(text=f"{fed_s}% (as of {fed_sd}) → {fed_e}% (as of {fed_ed})")
-        else:
-            interest_label_value.config(text="N/A")
-
-        if unemp_s is not None:
-            unemployment_label_value.config(text=f"{unemp_s}% (as of {unemp_sd}) → {unemp_e}% (as of {unemp_ed})")
-        else:
-            unemployment_label_value.config(text="N/A")
+        gdp_job = ex.submit(get_gdp_value, end_date)
 
-        if infl_s is not None:
-            inflation_label_value.config(text=f"{infl_s}% (as of {infl_sd}) → {infl_e}% (as of {infl_ed})")
-        else:
-            inflation_label_value.config(text="N/A")
-
-        # Bond Yields
-        bond1_label_value.config(text=(f"{bond1_s}% (as of {bond1_sd}) → {bond1_e}% (as of {bond1_ed})")
-                                   if bond1_s is not None else "N/A")
-        bond5_label_value.config(text=(f"{bond5_s}% (as of {bond5_sd}) → {bond5_e}% (as of {bond5_ed})")
-                                  if bond5_s is not None else "N/A")
-        bond10_label_value.config(text=(f"{bond10_s}% (as of {bond10_sd}) → {bond10_e}% (as of {bond10_ed})")
-                                   if bond10_s is not None else "N/A")
-        bond30_label_value.config(text=(f"{bond30_s}% (as of {bond30_sd}) → {bond30_e}% (as of {bond30_ed})")
-                                   if bond30_s is not None else "N/A")
-
-        # Nonfarm
-        if nf_s is not None:
-            nonfarm_label_value.config(text=f"{nf_s}k (as of {nf_sd}) → {nf_e}k (as of {nf_ed})")
-        else:
-            nonfarm_label_value.config(text="N/A")
-
-        # Housing
-        if hs_s is not None:
-            housing_label_value.config(text=f"{hs_s}k (as of {hs_sd}) → {hs_e}k (as of {hs_ed})")
-        else:
-            housing_label_value.config(text="N/A")
+        results = {s: starts[s].result() + ends[s].result() for s in FRED_RANGE_SERIES}
+        results["INFLATION"] = infl_job.result()
+        results["GDP"] = gdp_job.result()
+    return results
 
-        # GDP
-        if gdp_val is not None:
-            gdp_label_value.config(text=f"${gdp_val} Trillion (year {gdp_year})")
-        else:
-            gdp_label_value.config(text="N/A")
+def _date_str(ts):
+    """Formats a Timestamp as YYYY-MM-DD for display; None passes through."""
+    return ts.isoformat()[:10] if ts is not None else None
 
+def _apply_macro_data(key, future):
+    """Main-thread half of update_macro_data: formats the results into the macro labels."""
+    global _LAST_MACRO_KEY
+    try:
+        results = future.result()
     except Exception as e:
         set_status("Macro data error.")
         messagebox.showerror("Macro Data Error", f"Failed to fetch macroeconomic data:\n{e}")
         return
 
+    # Dates arrive as Timestamps; format each one once here (isoformat is much cheaper than strftime)
+    for series in (*FRED_RANGE_SERIES, "INFLATION"):
+        v_s, d_s, v_e, d_e = results[series]
+        results[series] = (v_s, _date_str(d_s), v_e, _date_str(d_e))
+
+    # Fed Funds Rate, Unemployment, Inflation
+    fed_s, fed_sd, fed_e, fed_ed = results["FEDFUNDS"]
+    unemp_s, unemp_sd, unemp_e, unemp_ed = results["UNRATE"]
+    infl_s, infl_sd, infl_e, infl_ed = results["INFLATION"]
+    # US Treasury Yields
+    bond1_s, bond1_sd, bond1_e, bond1_ed = results["DGS1"]
+    bond5_s, bond5_sd, bond5_e, bond5_ed = results["DGS5"]
+    bond10_s, bond10_sd, bond10_e, bond10_ed = results["DGS10"]
+    bond30_s, bond30_sd, bond30_e, bond30_ed = results["DGS30"]
+    # Nonfarm Payrolls, Housing Starts (in thousands)
+    nf_s, nf_sd, nf_e, nf_ed = results["PAYEMS"]
+    hs_s, hs_sd, hs_e, hs_ed = results["HOUST"]
+    # US GDP
+    gdp_val, gdp_year = results["GDP"]
+
+    # Format to show range
+    if fed_s is not None:
+        interest_label_value.config(text=f"{fed_s}% (as of {fed_sd}) → {fed_e}% (as of {fed_ed})")
+    else:
+        interest_label_value.config(text="N/A")
+
+    if unemp_s is not None:
+        unemployment_label_value.config(text=f"{unemp_s}% (as of {unemp_sd}) → {unemp_e}% (as of {unemp_ed})")
+    else:
+        unemployment_label_value.config(text="N/A")
+
+    if infl_s is not None:
+        inflation_label_value.config(text=f"{infl_s}% (as of {infl_sd}) → {infl_e}% (as of {infl_ed})")
+    else:
+        inflation_label_value.config(text="N/A")
+
+    # Bond Yields
+    bond1_label_value.config(text=(f"{bond1_s}% (as of {bond1_sd}) → {bond1_e}% (as of {bond1_ed})")
+                               if bond1_s is not None else "N/A")
+    bond5_label_value.config(text=(f"{bond5_s}% (as of {bond5_sd}) → {bond5_e}% (as of {bond5_ed})")
+                              if bond5_s is not None else "N/A")
+    bond10_label_value.config(text=(f"{bond10_s}% (as of {bond10_sd}) → {bond10_e}% (as of {bond10_ed})")
+                               if bond10_s is not None else "N/A")
+    bond30_label_value.config(text=(f"{bond30_s}% (as of {bond30_sd}) → {bond30_e}% (as of {bond30_ed})")
+                               if bond30_s is not None else "N/A")
+
+    # Nonfarm
+    if nf_s is not None:
+        nonfarm_label_value.config(text=f"{nf_s}k (as of {nf_sd}) → {nf_e}k (as of {nf_ed})")
+    else:
+        nonfarm_label_value.config(text="N/A")
+
+    # Housing
+    if hs_s is not None:
+        housing_label_value.config(text=f"{hs_s}k (as of {hs_sd}) → {hs_e}k (as of {hs_ed})")
+    else:
+        housing_label_value.config(text="N/A")
+
+    # GDP
+    if gdp_val is not None:
+        gdp_label_value.config(text=f"${gdp_val} Trillion (year {gdp_year})")
+    else:
+        gdp_label_value.config(text="N/A")
+
+    _LAST_MACRO_KEY = key
     set_status("Fetch complete.")
 
-def update_ticker_info():
-    """Fetches ticker info from yfinance and updates the Ticker Info tab."""
-    ticker = ticker_entry.get().strip()
-    if not ticker:
-        return
-    set_status(f"Loading Ticker Info for {ticker}...")
-    root.update_idletasks()
-
+def update_ticker_info(tkr=None):
+    """
+    Fetches ticker info from yfinance on a worker thread and updates the Ticker Info tab.
+    Reuses 'tkr' (a yf.Ticker) when given, otherwise looks up the entry's ticker.
+    """
+    if tkr is None:
+        symbols = parse_symbols(ticker_entry.get())
+        if not symbols:
+            return
+        tkr = get_ticker(symbols[0])
+    set_status(f"Loading Ticker Info for {tkr.ticker}...")
+    return _submit(getattr, tkr, "info", on_done=_apply_ticker_info)
+
+def _apply_ticker_info(future):
+    """Main-thread half of update_ticker_info: fills in the Ticker Info tab."""
     try:
-        info = yf.Ticker(ticker).info
+        info = future.result()
     except Exception as e:
         set_status("Error loading ticker info.")
         messagebox.showerror("Data Fetch Error", f"Failed to fetch ticker info:\n{e}")
@@ -336,6 +660,7 @@ def update_ticker_info():
     ticker_sector_value.config(text=sector)
     ticker_industry_value.config(text=industry)
     ticker_website_value.config(text=website)
+    set_status("Fetch complete.")
 
 # ------------------------------------------------------------------------------------
 # Splash Screen
@@ -346,8 +671,17 @@ def show_splash():
     splash.geometry("400x200+500+400")
     splash_label = ttk.Label(splash, text="Loading Finance Dashboard...", font=("Arial", 16))
     splash_label.pack(expand=True)
-    root.after(2000, splash.destroy)
-    root.after(2000, lambda: (root.deiconify(), update_all_data()))
+
+    def close_splash():
+        splash.destroy()
+        root.deiconify()
+
+    # Start the first fetch right away and keep the splash up only until it lands
+    future = update_all_data()
+    if future is None:
+        close_splash()
+    else:
+        future.add_done_callback(lambda _fut: root.after(0, close_splash))
 
 # ------------------------------------------------------------------------------------
 # Main Application
@@ -378,8 +712,8 @@ dashboard_input_frame.pack(fill="x")
 dashboard_input_frame.columnconfigure(1, weight=1)
 
 # Row 0
-ttk.Label(dashboard_input_frame, text="Stock Ticker:", font=("Arial", 12)).grid(row=0, column=0, padx=5, pady=5, sticky="e")
-ticker_entry = ttk.Entry(dashboard_input_frame, width=15, font=("Arial", 12))
+ttk.Label(dashboard_input_frame, text="Stock Ticker(s):", font=("Arial", 12)).grid(row=0, column=0, padx=5, pady=5, sticky="e")
+ticker_entry = ttk.Entry(dashboard_input_frame, width=25, font=("Arial", 12))
 ticker_entry.insert(0, "AAPL")
 ticker_entry.grid(row=0, column=1, padx=5, pady=5, sticky="w")
 ticker_entry.bind("<Return>", lambda event: update_all_data())
@@ -404,13 +738,34 @@ refresh_interval = tk.IntVar(value=60000)
 refresh_entry = ttk.Entry(dashboard_input_frame, width=8, textvariable=refresh_interval, font=("Arial", 12))
 refresh_entry.grid(row=0, column=8, padx=5, pady=5, sticky="w")
 
+# Refetch macro data even if the Macro Date and day are unchanged
+force_refresh_var = tk.BooleanVar(value=False)
+force_refresh_check = ttk.Checkbutton(dashboard_input_frame, text="Force Refresh", variable=force_refresh_var)
+force_refresh_check.grid(row=0, column=9, padx=5, pady=5, sticky="w")
+
 fetch_btn = ttk.Button(dashboard_input_frame, text="Fetch Data", command=update_all_data)
-fetch_btn.grid(row=0, column=9, padx=10, pady=5)
+fetch_btn.grid(row=0, column=10, padx=10, pady=5)
 
 # Chart Frame
 chart_frame = ttk.Frame(tab_dashboard, padding=10)
 chart_frame.pack(fill="both", expand=True)
 fig_stock, ax_stock = plt.subplots(figsize=(10, 6), dpi=100)
+ax_vol = ax_stock.twinx()  # Volatility shares the date axis but has its own scale
+# Lines, labels and legend are created once; each Fetch only swaps the line data
+line_price, = ax_stock.plot([], [], label="Close", color="blue")
+line_ma50, = ax_stock.plot([], [], label="50-Day MA", color="orange")
+line_ma200, = ax_stock.plot([], [], label="200-Day MA", color="green")
+line_vol, = ax_vol.plot([], [], label="90-Day Volatility", color="purple", alpha=0.6)
+ax_stock.xaxis_date()
+ax_stock.set_xlabel("Date")
+ax_stock.set_ylabel("Price (USD)")
+ax_stock.grid(True)
+ax_vol.set_ylabel("Annualized Volatility")
+stock_legend = ax_stock.legend(
+    [line_price, line_ma50, line_ma200, line_vol],
+    [line.get_label() for line in (line_price, line_ma50, line_ma200, line_vol)],
+    loc="upper left",
+)
 canvas_stock = FigureCanvasTkAgg(fig_stock, master=chart_frame)
 canvas_stock.get_tk_widget().pack(fill="both", expand=True)
 
@@ -427,8 +782,11 @@ stock_end_label_value.grid(row=2, column=1, sticky="w", padx=5)
 ttk.Label(stock_info_frame, text="Change:", font=("Arial", 12)).grid(row=3, column=0, sticky="w", padx=5)
 stock_change_label_value = ttk.Label(stock_info_frame, text="N/A", font=("Arial", 12, "bold"))
 stock_change_label_value.grid(row=3, column=1, sticky="w", padx=5)
+ttk.Label(stock_info_frame, text="Watchlist:", font=("Arial", 12)).grid(row=4, column=0, sticky="w", padx=5)
+watchlist_label_value = ttk.Label(stock_info_frame, text="N/A", font=("Arial", 12, "bold"))
+watchlist_label_value.grid(row=4, column=1, sticky="w", padx=5)
 last_update_label = ttk.Label(stock_info_frame, text="Last Updated: N/A", font=("Arial", 10))
-last_update_label.grid(row=4, column=0, columnspan=2, sticky="w", padx=5, pady=5)
+last_update_label.grid(row=5, column=0, columnspan=2, sticky="w", padx=5, pady=5)
 
 # Macro Data Info
 macro_info_frame = ttk.Frame(tab_dashboard, relief="groove", padding=10)
@@ -548,3 +906,4 @@ def splash_screen():
 splash_screen()
 
 root.mainloop()
+_HTTP.close()
@@ -14,22 +14,32 @@ Libraries used and demonstrated:
   8) multiprocessing (Standard Library)
 
 Note: 
-  - You may need to `pip install requests paramiko psycopg2-binary pyyaml cryptography pandas`
+  - You may need to `pip install requests orjson joblib paramiko psycopg2-binary pyyaml cryptography pandas`
     and possibly `pip install psycopg2` or `apt-get install libpq-dev python3-dev` for full DB support.
   - Replace sample credentials, server IPs, database details, etc. for real usage.
 """
 
+import atexit
+import datetime
+import hashlib
+import itertools
 import logging
+import re
 import sys
 import os
-import time
+import uuid
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import joblib
+import orjson
 import paramiko
-import psycopg2
+from psycopg2 import extensions as pg_extensions, extras as pg_extras, pool as pg_pool
 import yaml
 from cryptography.fernet import Fernet
+import numpy as np
 import pandas as pd
-from multiprocessing import Process, Queue
+from multiprocessing import Pool
 
 
 # ------------------------------------------------------------------------------
@@ -52,19 +62,46 @@ logger = logging.getLogger("ProdSupportDemo")
 # 2) REQUESTS EXAMPLE
 # ------------------------------------------------------------------------------
 
+# One pooled keep-alive session for all API calls: repeat requests to the same host reuse
+# the TCP/TLS connection instead of handshaking every time, and transient 5xx are retried.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=100,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+
+# Disk cache for API responses; keyed on (url, day) so entries expire daily. It lives under
+# the user's home directory so running the script doesn't leave files in the working dir.
+_MEMORY = joblib.Memory(os.path.join(os.path.expanduser("~"), ".mccookbook_cache", "joblib"), verbose=0)
+# Every key includes the day, so entries not used since yesterday are never read again;
+# prune them at startup so the cache directory doesn't grow without bound
+_MEMORY.reduce_size(age_limit=datetime.timedelta(days=1))
+
+
+@_MEMORY.cache
+def _download_json(api_url, day):
+    """Fetches and decodes 'api_url'. Raises on failure, so errors are never cached."""
+    logger.info(f"Fetching data from {api_url}")
+    response = _SESSION.get(api_url, timeout=(3, 5))  # (connect, read)
+    response.raise_for_status()  # raise an HTTPError if the status is >= 400
+    return orjson.loads(response.content)  # Much faster than stdlib json on large payloads
+
+
 def fetch_data_from_api(api_url):
     """
     Demonstrates fetching JSON data from an external API.
+    Responses are cached on disk for the rest of the day (see _download_json).
     For production usage, handle exceptions, timeouts, authentication, etc.
     """
     try:
-        logger.info(f"Fetching data from {api_url}")
-        response = requests.get(api_url, timeout=5)
-        response.raise_for_status()  # raise an HTTPError if the status is >= 400
-        data = response.json()
+        data = _download_json(api_url, datetime.date.today().isoformat())
         logger.info("Data fetched successfully!")
         return data
-    except requests.RequestException as e:
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
         logger.error(f"API request failed: {e}")
         return {}
 
@@ -107,35 +144,108 @@ def ssh_demo(server_ip, username, password):
 # 4) PSYCOPG2 (PostgreSQL) EXAMPLE
 # ------------------------------------------------------------------------------
 
-def query_database(db_config):
+class PreparedConnection(pg_extensions.connection):
+    """
+    psycopg2 connection that PREPAREs each distinct SQL string once and EXECUTEs it
+    afterwards, so repeated queries skip parse/plan. Prepared statements live for the
+    session, so this needs a session-level pool (not PgBouncer transaction mode).
     """
-    Demonstrates connecting to a PostgreSQL database using psycopg2
-    and executing a basic SELECT query.
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = {}  # sql -> statement name
+
+    def execute_prepared(self, cur, sql, params=None):
+        name = self.prepared.get(sql)
+        if name is None:
+            name = f"stmt_{len(self.prepared)}"
+            position = itertools.count(1)
+            cur.execute(f"PREPARE {name} AS " + re.sub(r"%s", lambda _m: f"${next(position)}", sql))
+            self.prepared[sql] = name
+        if params:
+            cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+        else:
+            cur.execute(f"EXECUTE {name}")
+
+
+# One pool per process: connect/auth happens a few times up front, not once per query
+_DB_POOL = None
+
+def get_db_pool(db_config, minconn=2, maxconn=16):
+    """
+    Returns the module-level psycopg2 ThreadedConnectionPool, creating it on first use.
     'db_config' should be a dict with keys: dbname, user, password, host, port
     """
-    conn = None
-    try:
-        logger.info("Connecting to PostgreSQL database...")
-        conn = psycopg2.connect(**db_config)  # e.g., dbname='testdb', user='dbuser', etc.
-        cur = conn.cursor()
+    global _DB_POOL
+    if _DB_POOL is None:
+        logger.info("Creating PostgreSQL connection pool...")
+        _DB_POOL = pg_pool.ThreadedConnectionPool(
+            minconn, maxconn, connection_factory=PreparedConnection, **db_config
+        )
+    return _DB_POOL
 
-        # Simple query: get current date/time from DB
-        cur.execute("SELECT NOW();")
-        row = cur.fetchone()
-        logger.info(f"Database current time: {row[0]}")
 
-        cur.close()
+def query_database(pool, sql="SELECT NOW()", params=None, batch=10_000, prepared=False):
+    """
+    Demonstrates running a query on a pooled PostgreSQL connection and streaming the
+    results through a named (server-side) cursor, 'batch' rows per round-trip.
+    With prepared=True the statement is instead PREPAREd once per pooled connection
+    and EXECUTEd (see PreparedConnection) - the better fit for short, recurring queries.
+    Yields lists of row tuples; the connection goes back to 'pool' when done.
+    """
+    conn = pool.getconn()
+    try:
+        if prepared:
+            cur = conn.cursor()
+            conn.execute_prepared(cur, sql, params)
+        else:
+            cur = conn.cursor(name=f"q_{uuid.uuid4().hex}")
+            cur.itersize = batch
+            cur.execute(sql, params)
+        with cur:
+            while True:
+                rows = cur.fetchmany(batch)
+                if not rows:
+                    break
+                yield rows
+        conn.commit()
     except Exception as e:
+        conn.rollback()
         logger.error(f"Database operation failed: {e}")
     finally:
-        if conn:
-            conn.close()
+        pool.putconn(conn)
+
+
+def insert_rows(pool, sql, rows, batch=10_000):
+    """
+    Demonstrates bulk inserts: 'sql' is an "INSERT ... VALUES %s" statement and
+    execute_values expands it into multi-row INSERTs of up to 'batch' rows each,
+    instead of one round-trip per row.
+    """
+    conn = pool.getconn()
+    try:
+        with conn.cursor() as cur:
+            pg_extras.execute_values(cur, sql, rows, page_size=batch)
+        conn.commit()
+        logger.info(f"Inserted {len(rows)} rows.")
+    except Exception as e:
+        conn.rollback()
+        logger.error(f"Database insert failed: {e}")
+    finally:
+        pool.putconn(conn)
 
 
 # ------------------------------------------------------------------------------
 # 5) YAML (CONFIG) EXAMPLE
 # ------------------------------------------------------------------------------
 
+# Prefer PyYAML's libyaml-backed loader (much faster); fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
 def load_config(config_path):
     """
     Demonstrates reading a YAML config file and returning its contents as a dict.
@@ -146,7 +256,7 @@ def load_config(config_path):
 
     logger.info(f"Loading YAML config from {config_path}")
     with open(config_path, "r") as f:
-        config_data = yaml.safe_load(f)
+        config_data = yaml.load(f.read(), Loader=_YamlLoader)
     logger.info(f"Config loaded: {config_data}")
     return config_data
 
@@ -155,37 +265,50 @@ def load_config(config_path):
 # 6) CRYPTOGRAPHY (FERNET) EXAMPLE
 # ------------------------------------------------------------------------------
 
+# Generate the key and build the cipher once (in real usage, store/retrieve the key securely)
+_KEY = Fernet.generate_key()
+_CIPHER = Fernet(_KEY)
+
+
 def encrypt_decrypt_demo(message):
     """
     Demonstrates encrypting and decrypting a message with the Fernet symmetric key.
     """
-    # Generate a key (in real usage, store/retrieve securely)
-    key = Fernet.generate_key()
-    cipher = Fernet(key)
-
     logger.info(f"Original message: {message}")
-    encrypted = cipher.encrypt(message.encode('utf-8'))
+    encrypted = _CIPHER.encrypt(message.encode('utf-8'))
     logger.info(f"Encrypted message: {encrypted}")
 
-    decrypted = cipher.decrypt(encrypted).decode('utf-8')
+    decrypted = _CIPHER.decrypt(encrypted).decode('utf-8')
     logger.info(f"Decrypted message: {decrypted}")
+    return decrypted
+
+
+def bulk_encrypt(messages):
+    """Encrypts a list of byte strings with the shared cipher, one token per message."""
+    return [_CIPHER.encrypt(m) for m in messages]
 
 
 # ------------------------------------------------------------------------------
 # 7) PANDAS EXAMPLE
 # ------------------------------------------------------------------------------
 
-def analyze_data_with_pandas(data):
+# Field layout of the jsonplaceholder /posts records used in the demo
+POST_COLUMNS = ("userId", "id", "title", "body")
+
+
+def analyze_data_with_pandas(data, columns=None):
     """
     Demonstrates using pandas to turn a list of dicts into a DataFrame
     and performing some basic analysis.
     'data' can be any list of dictionaries. We'll do a trivial example.
+    Pass 'columns' when the record layout is known, so pandas loads just those
+    fields in bulk instead of scanning every dict for its keys.
     """
     if not data:
         logger.warning("No data provided to analyze.")
         return
 
-    df = pd.DataFrame(data)
+    df = pd.DataFrame.from_records(data, columns=columns)
     logger.info(f"DataFrame created:\n{df}")
 
     # Example: show descriptive stats if numeric columns exist
@@ -200,32 +323,59 @@ def analyze_data_with_pandas(data):
 # 8) MULTIPROCESSING EXAMPLE
 # ------------------------------------------------------------------------------
 
-def worker_process(queue, idx):
-    """Simple worker that reads data from a queue, 'processes' it, and logs results."""
-    while not queue.empty():
-        item = queue.get()
-        logger.info(f"[Worker {idx}] Processing item: {item}")
-        time.sleep(0.5)  # Simulate some work
+NUM_WORKERS = os.cpu_count() or 2
+_POOL = None  # Created on first use and reused, so workers stay warm between runs
 
 
-def run_multiprocessing_demo(data_items):
+def _init_logger():
+    """Runs once in each pool worker at startup: sets up that process's logger."""
+    global logger
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
+    logger = logging.getLogger(f"ProdSupportDemo.worker-{os.getpid()}")
+
+
+def _kernel(item):
+    """Small CPU-bound stand-in for real work: hash the item and sum the digest bytes."""
+    digest = np.frombuffer(hashlib.sha256(str(item).encode()).digest(), dtype=np.uint8)
+    return int(digest.sum())
+
+
+def worker(item):
+    """Simple worker that 'processes' one item and logs the result."""
+    result = _kernel(item)  # Real compute rather than a sleep, so pool timings mean something
+    logger.info(f"Processed item: {item} -> {result}")
+    return result
+
+
+def _get_pool():
+    global _POOL
+    if _POOL is None:
+        _POOL = Pool(processes=NUM_WORKERS, initializer=_init_logger)
+        atexit.register(_close_pool)
+    return _POOL
+
+
+def _close_pool():
     """
-    Demonstrates the multiprocessing library by creating multiple worker processes
-    that pull tasks from a shared queue.
+    Shuts the pool down cleanly at exit: close() has the task handler send each worker
+    a stop sentinel once the queue is drained, and join() waits for them to finish.
     """
-    queue = Queue()
-    for item in data_items:
-        queue.put(item)
+    _POOL.close()
+    _POOL.join()
 
-    processes = []
-    num_workers = 2  # For example
-    for i in range(num_workers):
-        p = Process(target=worker_process, args=(queue, i))
-        processes.append(p)
-        p.start()
 
-    for p in processes:
-        p.join()
+def run_multiprocessing_demo(data_items):
+    """
+    Demonstrates the multiprocessing library by fanning tasks out to a persistent
+    worker Pool. Workers are forked once and reused across calls, so each task costs
+    a queue hop rather than a process start.
+    """
+    chunksize = max(1, len(data_items) // (4 * NUM_WORKERS))
+    return list(_get_pool().imap_unordered(worker, data_items, chunksize=chunksize))
 
 
 # ------------------------------------------------------------------------------
@@ -254,7 +404,9 @@ if __name__ == "__main__":
     #     "host": "127.0.0.1",
     #     "port": 5432,
     # }
-    # query_database(db_config)
+    # db_pool = get_db_pool(db_config)
+    # for rows in query_database(db_pool):
+    #     logger.info(f"Database current time: {rows[0][0]}")
 
     # 5) YAML config
     # config = load_config("app_config.yaml")
@@ -264,7 +416,7 @@ if __name__ == "__main__":
 
     # 7) pandas
     # We'll use the data fetched from the API (which is a list of dicts) as a simple example
-    analyze_data_with_pandas(api_data)
+    analyze_data_with_pandas(api_data, columns=POST_COLUMNS)
 
     # 8) multiprocessing
     # We'll just demonstrate parallel processing on some test data
@@ -15,22 +15,80 @@ Usage:
 import tkinter as tk
 from tkinter import ttk, messagebox
 import datetime
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+import requests
+import joblib
 import yfinance as yf
 from pandas_datareader import data as pdr
 import wbdata
 
+# Shared keep-alive session for the FRED requests, so the three series reuse one connection
+_SESSION = requests.Session()
+
+# Pickled results on disk, so a restart the same day skips the downloads entirely.
+# Exceptions are not cached, so a failed fetch is retried next time. Stored under the
+# user's home directory rather than wherever the script happens to be launched from.
+_MEMORY = joblib.Memory(os.path.join(os.path.expanduser("~"), ".mccookbook_cache", "joblib"), verbose=0)
+# Every key includes the day, so entries not used since yesterday are never read again;
+# prune them at startup so the cache directory doesn't grow without bound
+_MEMORY.reduce_size(age_limit=datetime.timedelta(days=1))
+
 import matplotlib
 matplotlib.use("TkAgg")  # Use TkAgg for embedding in tkinter
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 # --- Function to Fetch Market Data and Update Chart ---
+# yf.Ticker objects reused per symbol for the life of the process, so repeat fetches
+# don't rebuild the Ticker (and its cached metadata) on every click
+_TICKERS = {}
+
+def _get_ticker(symbol):
+    tkr = _TICKERS.get(symbol)
+    if tkr is None:
+        tkr = _TICKERS[symbol] = yf.Ticker(symbol)
+    return tkr
+
+@_MEMORY.cache
+def _history_cached(ticker, period, day):
+    """
+    Price history for 'ticker' over 'period', cached on disk under 'day' (today's date).
+    An empty result raises LookupError instead of being cached, so it is retried next time.
+    """
+    data = _get_ticker(ticker).history(period=period)
+    if data.empty:
+        raise LookupError(ticker)
+    return data
+
+# Incremented per fetch; a response is only applied if it is still the latest request
+_request_id = 0
+
+def _fetch_async(ticker, period, on_done):
+    """
+    Downloads price history on a daemon thread and hands (data, error) to
+    on_done on the Tk thread via root.after.
+    """
+    def run():
+        try:
+            data, error = _history_cached(ticker, period, datetime.date.today().isoformat()), None
+        except LookupError:
+            data, error = None, None  # Yahoo returned no rows
+        except Exception as e:
+            data, error = None, e
+        root.after(0, on_done, data, error)
+
+    threading.Thread(target=run, daemon=True).start()
+
 def update_plot():
     """
-    Fetches stock data for the selected ticker and period,
-    updates the embedded Matplotlib chart, and then fetches macro data.
+    Starts a background fetch of stock data for the selected ticker and period;
+    _apply_plot updates the chart (and kicks off the macro fetch) when it lands.
     """
+    global _request_id
     ticker = ticker_entry.get().strip()
     period = period_var.get()
 
@@ -38,78 +96,112 @@ def update_plot():
         messagebox.showwarning("Input Error", "Please enter a valid stock ticker.")
         return
 
-    try:
-        data = yf.Ticker(ticker).history(period=period)
-    except Exception as e:
-        messagebox.showerror("Data Fetch Error", f"Failed to download stock data:\n{e}")
+    _request_id += 1
+    request_id = _request_id
+    _fetch_async(ticker, period,
+                 lambda data, error: _apply_plot(request_id, ticker, period, data, error))
+
+def _apply_plot(request_id, ticker, period, data, error):
+    """Runs on the Tk thread: redraws the chart with a finished download."""
+    if request_id != _request_id:
+        return  # A newer request was made while this one was in flight
+
+    if error is not None:
+        messagebox.showerror("Data Fetch Error", f"Failed to download stock data:\n{error}")
         return
 
-    if data.empty:
+    if data is None:
         messagebox.showinfo("No Data", f"No stock data found for '{ticker}' with period '{period}'.")
         return
 
     # Use Adjusted Close if available, otherwise use Close
     price_col = "Adj Close" if "Adj Close" in data.columns else "Close"
 
-    # Clear previous chart and plot new data
-    ax.clear()
-    ax.plot(data.index, data[price_col], label=f"{ticker} ({period})", color="blue")
+    # Swap the data on the persistent line instead of clearing and rebuilding the axes
+    price_line.set_data(data.index, data[price_col])
+    price_line.set_label(f"{ticker} ({period})")
     ax.set_title(f"{ticker} Price Over {period}")
-    ax.set_xlabel("Date")
     ax.set_ylabel(f"{price_col} (USD)")
     ax.legend()
-    ax.grid(True)
-    canvas.draw()
+    ax.relim()
+    ax.autoscale_view()
+    canvas.draw_idle()  # Coalesces redraws across rapid clicks
 
     # After updating the chart, update macro data
     update_macro_data()
 
 
 # --- Function to Fetch and Update Macro Data ---
-def update_macro_data():
+# The four macro downloads are independent and IO-bound, so they run side by side here
+_EXEC = ThreadPoolExecutor(max_workers=4)
+
+def _fetch_fred(series_id, start_date, end_date):
+    # Key the disk cache on calendar dates (not datetimes) so it hits for the rest of the day
+    return _fred_cached(series_id, start_date.date().isoformat(), end_date.date().isoformat())
+
+@_MEMORY.cache
+def _fred_cached(series_id, start_iso, end_iso):
+    return pdr.get_data_fred(series_id, start=start_iso, end=end_iso, session=_SESSION)
+
+@functools.lru_cache(maxsize=1)
+@_MEMORY.cache
+def _fetch_gdp(day):
     """
-    Fetches macroeconomic indicators from FRED and World Bank,
-    then updates the corresponding labels with both value and date.
+    GDP is annual, so one download per day is plenty: the result is cached under
+    today's date and only refetched once the day rolls over (or after a failure).
     """
+    indicators = {"NY.GDP.MKTP.CD": "GDP"}
+    return wbdata.get_dataframe(indicators, country="US")
+
+def _show_interest(interest_rate):
+    interest_value = round(interest_rate.iloc[-1, 0], 2)
+    interest_date = interest_rate.index[-1].strftime("%Y-%m-%d")
+    interest_label_value.config(text=f"{interest_value}% (as of {interest_date})")
+
+def _show_unemployment(unemployment_rate):
+    unemployment_value = round(unemployment_rate.iloc[-1, 0], 2)
+    unemployment_date = unemployment_rate.index[-1].strftime("%Y-%m-%d")
+    unemployment_label_value.config(text=f"{unemployment_value}% (as of {unemployment_date})")
+
+def _show_inflation(inflation_rate):
+    # Full YoY series in one vectorized pass (monthly CPI, so 12 periods back = one year)
+    yoy = inflation_rate.iloc[:, 0].pct_change(12).mul(100).round(2)
+    inflation_value = float(yoy.iloc[-1])
+    inflation_date = yoy.index[-1].strftime("%Y-%m-%d")
+    inflation_label_value.config(text=f"{inflation_value}% YoY (as of {inflation_date})")
+
+def _show_gdp(gdp_data):
+    gdp_value = round(gdp_data.iloc[-1, 0] / 1e12, 2)  # Convert dollars to trillions
+    # Use the year of the latest GDP data
+    gdp_date = gdp_data.index[-1].year if hasattr(gdp_data.index[-1], "year") else "N/A"
+    gdp_label_value.config(text=f"${gdp_value} Trillion (as of {gdp_date})")
+
+def _apply_macro(show, future):
+    """Runs on the Tk thread: hands one finished download to its label updater."""
     try:
-        # Define a 5-year date range for FRED data
-        end_date = datetime.datetime.today()
-        start_date = end_date - datetime.timedelta(days=365 * 5)
-
-        # Fetch FRED data for US Macroeconomic Indicators
-        interest_rate = pdr.get_data_fred("FEDFUNDS", start=start_date, end=end_date)
-        unemployment_rate = pdr.get_data_fred("UNRATE", start=start_date, end=end_date)
-        inflation_rate = pdr.get_data_fred("CPIAUCSL", start=start_date, end=end_date)
-
-        # Extract the most recent values and their dates
-        interest_value = round(interest_rate.iloc[-1, 0], 2)
-        interest_date = interest_rate.index[-1].strftime("%Y-%m-%d")
-
-        unemployment_value = round(unemployment_rate.iloc[-1, 0], 2)
-        unemployment_date = unemployment_rate.index[-1].strftime("%Y-%m-%d")
-
-        inflation_value = round(
-            ((inflation_rate.iloc[-1, 0] - inflation_rate.iloc[-12, 0]) / inflation_rate.iloc[-12, 0]) * 100,
-            2
-        )
-        inflation_date = inflation_rate.index[-1].strftime("%Y-%m-%d")
-
-        # Fetch World Bank GDP Data for the US
-        indicators = {"NY.GDP.MKTP.CD": "GDP"}
-        gdp_data = wbdata.get_dataframe(indicators, country="US")
-        gdp_value = round(gdp_data.iloc[-1, 0] / 1e12, 2)  # Convert dollars to trillions
-        # Use the year of the latest GDP data
-        gdp_date = gdp_data.index[-1].year if hasattr(gdp_data.index[-1], "year") else "N/A"
-
-        # Update UI Labels with values and their dates
-        interest_label_value.config(text=f"{interest_value}% (as of {interest_date})")
-        unemployment_label_value.config(text=f"{unemployment_value}% (as of {unemployment_date})")
-        inflation_label_value.config(text=f"{inflation_value}% YoY (as of {inflation_date})")
-        gdp_label_value.config(text=f"${gdp_value} Trillion (as of {gdp_date})")
-
+        show(future.result())
     except Exception as e:
         messagebox.showerror("Macro Data Error", f"Failed to fetch macroeconomic data:\n{e}")
 
+def update_macro_data():
+    """
+    Fetches macroeconomic indicators from FRED and World Bank concurrently on a
+    worker pool; each label is updated (on the Tk thread) as soon as its data arrives.
+    """
+    # Define a 5-year date range for FRED data
+    end_date = datetime.datetime.today()
+    start_date = end_date - datetime.timedelta(days=365 * 5)
+
+    jobs = {
+        _EXEC.submit(_fetch_fred, "FEDFUNDS", start_date, end_date): _show_interest,
+        _EXEC.submit(_fetch_fred, "UNRATE", start_date, end_date): _show_unemployment,
+        _EXEC.submit(_fetch_fred, "CPIAUCSL", start_date, end_date): _show_inflation,
+        _EXEC.submit(_fetch_gdp, datetime.date.today()): _show_gdp,
+    }
+    for future, show in jobs.items():
+        # Widgets may only be touched from the Tk thread, so marshal the result back
+        future.add_done_callback(lambda fut, show=show: root.after(0, _apply_macro, show, fut))
+
 
 # --- Splash Screen ---
 def show_splash():
@@ -161,6 +253,11 @@ plot_btn.grid(row=2, column=0, columnspan=2, pady=10)
 
 # --- 2) MATPLOTLIB CHART EMBEDDED ---
 fig, ax = plt.subplots(figsize=(10, 6), dpi=100)
+# Built once; update_plot only swaps its data
+price_line, = ax.plot([], [], color="blue")
+ax.xaxis_date()
+ax.set_xlabel("Date")
+ax.grid(True)
 canvas = FigureCanvasTkAgg(fig, master=root)
 canvas.get_tk_widget().grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
 
@@ -9,16 +9,76 @@ Usage:
     python market_data_plot.py
 
 Dependencies:
-    pip install yfinance matplotlib
+    pip install yfinance matplotlib pandas joblib
 """
 
+import datetime
+import os
+
+import joblib
+import pandas as pd
 import yfinance as yf
 import matplotlib.pyplot as plt
 
+# Downloads pickled on disk, keyed by (ticker, period, day), so re-running the script later
+# the same day skips the download entirely.
+_MEMORY = joblib.Memory(os.path.join(os.path.expanduser("~"), ".mccookbook_cache", "joblib"), verbose=0)
+# Entries from earlier days are never read again; prune them at startup
+_MEMORY.reduce_size(age_limit=datetime.timedelta(days=1))
+
+def _period_to_timedelta(period: str):
+    """
+    Maps a yfinance period string to a pandas DateOffset (e.g. "1mo" -> DateOffset(months=1)).
+    Returns None for "ytd" and "max", which are not fixed lengths.
+    """
+    if period in ("ytd", "max"):
+        return None
+    if period.endswith("mo"):
+        return pd.DateOffset(months=int(period[:-2]))
+    if period.endswith("y"):
+        return pd.DateOffset(years=int(period[:-1]))
+    if period.endswith("d"):
+        return pd.DateOffset(days=int(period[:-1]))
+    raise ValueError(f"Unsupported period: {period}")
+
+def _period_start(period, today):
+    """
+    Returns the earliest date 'period' covers counting back from 'today', or None for "max".
+    "ytd" starts on Jan 1, so whether it is longer than "3mo" depends on the time of year.
+    """
+    if period == "max":
+        return None
+    if period == "ytd":
+        return pd.Timestamp(today.year, 1, 1)
+    return today - _period_to_timedelta(period)
+
+def _slice_period(full, period):
+    """Returns the trailing slice of 'full' that 'period' covers."""
+    if period == "max":
+        return full
+    today = full.index.max()
+    if period == "ytd":
+        return full[full.index.year == today.year]
+    return full[full.index > today - _period_to_timedelta(period)]
+
+@_MEMORY.cache
+def _download_cached(ticker, period, day):
+    """
+    Daily 'ticker' history over 'period' with flat columns, cached on disk under 'day'
+    (today's date). An empty result raises LookupError instead of being cached.
+    """
+    full = yf.download(ticker, period=period, interval="1d", auto_adjust=False, progress=False)
+    if full.empty:
+        raise LookupError(ticker)
+    if isinstance(full.columns, pd.MultiIndex):
+        full = full.droplevel(1, axis=1)  # Newer yfinance adds a (upper-cased) ticker column level
+    return full
+
 def plot_stock_data_for_periods(ticker: str, periods=None):
     """
-    Downloads market data for the specified 'ticker' from Yahoo Finance,
-    then plots the 'Adj Close' price for each preset time period on separate subplots.
+    Downloads market data for the specified 'ticker' from Yahoo Finance once (for the
+    longest period), then plots the 'Adj Close' price for each preset time period
+    on separate subplots, slicing the shorter periods out of that one download.
 
     :param ticker: Stock ticker symbol (e.g., 'AAPL', 'TSLA', 'GOOG')
     :param periods: List of time periods accepted by yfinance's 'history' method
@@ -28,15 +88,22 @@ def plot_stock_data_for_periods(ticker: str, periods=None):
         # Common preset periods: 1m, 3m, 6m, 1y, 5y, ytd, etc.
         periods = ["1mo", "3mo", "6mo", "1y"]
 
+    # One request for the longest period (earliest start); every shorter period is a trailing slice of it
+    today = pd.Timestamp.today().normalize()
+    max_period = min(periods, key=lambda p: _period_start(p, today) or pd.Timestamp.min)
+    print(f"Downloading data for ticker={ticker}, period={max_period}...")
+    try:
+        full = _download_cached(ticker, max_period, today.date().isoformat())
+    except LookupError:
+        print(f"No data returned for ticker={ticker}, period={max_period}.")
+        return
+
     # We'll create one subplot per period
     fig, axes = plt.subplots(len(periods), 1, figsize=(10, 5 * len(periods)), sharex=False)
     fig.suptitle(f"{ticker} Stock Price - Various Time Periods", fontsize=16)
 
     for i, period in enumerate(periods):
-        # Download data for this period
-        # 'history(period=...)' automatically ends at the current date
-        print(f"Downloading data for ticker={ticker}, period={period}...")
-        data = yf.Ticker(ticker).history(period=period)
+        data = _slice_period(full, period)
 
         # Plot on the respective subplot
         ax = axes[i] if len(periods) > 1 else axes  # axes is an array if multiple, single if 1
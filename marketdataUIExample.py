@@ -11,9 +11,40 @@ Usage:
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import datetime
+import os
+
+import joblib
 import yfinance as yf
 import matplotlib.pyplot as plt
 
+# yf.Ticker objects reused per symbol for the life of the process, so repeat fetches
+# don't rebuild the Ticker (and its cached metadata) on every click
+_TICKERS = {}
+
+def _get_ticker(symbol):
+    tkr = _TICKERS.get(symbol)
+    if tkr is None:
+        tkr = _TICKERS[symbol] = yf.Ticker(symbol)
+    return tkr
+
+# Price histories pickled on disk, keyed by (ticker, period, day), so re-plotting the same
+# ticker/period later the same day (even after a restart) skips the download entirely.
+_MEMORY = joblib.Memory(os.path.join(os.path.expanduser("~"), ".mccookbook_cache", "joblib"), verbose=0)
+# Entries from earlier days are never read again; prune them at startup
+_MEMORY.reduce_size(age_limit=datetime.timedelta(days=1))
+
+@_MEMORY.cache
+def _history_cached(ticker, period, day):
+    """
+    Price history for 'ticker' over 'period', cached on disk under 'day' (today's date).
+    An empty result raises LookupError instead of being cached, so it is retried next time.
+    """
+    data = _get_ticker(ticker).history(period=period)
+    if data.empty:
+        raise LookupError(ticker)
+    return data
+
 def fetch_and_plot(ticker: str, period: str):
     """
     Downloads historical data for 'ticker' over the given 'period'
@@ -24,15 +55,14 @@ def fetch_and_plot(ticker: str, period: str):
         return
 
     try:
-        data = yf.Ticker(ticker).history(period=period)
+        data = _history_cached(ticker, period, datetime.date.today().isoformat())
+    except LookupError:
+        messagebox.showinfo("No Data", f"No data returned for ticker '{ticker}' with period '{period}'.")
+        return
     except Exception as e:
         messagebox.showerror("Error", f"Failed to download data: {e}")
         return
 
-    if data.empty:
-        messagebox.showinfo("No Data", f"No data returned for ticker '{ticker}' with period '{period}'.")
-        return
-
     # Use 'Adj Close' if available, else 'Close'
     price_col = "Adj Close" if "Adj Close" in data.columns else "Close"
 
@@ -3,46 +3,123 @@
 # Demonstrates a typical production support script that connects
 # to remote servers, fetches logs, and checks for errors.
 
-import paramiko
+import atexit
+import logging
 import re
+import shlex
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-def check_logs_for_errors(host, username, password, log_path):
-    """
-    SSH into a remote host, read the log file,
-    search for critical errors, and print them.
-    """
+import paramiko
+
+# Hosts are checked from several threads at once; logging keeps their lines whole
+logger = logging.getLogger("ProdSupport")
+
+# Live SSH connections keyed by (host, username), reused across checks so repeat
+# polls of the same fleet skip the TCP connect, key exchange and auth
+_SSH_CLIENTS = {}
+_SSH_CLIENTS_LOCK = threading.Lock()
+
+def _is_live(client):
+    transport = client.get_transport() if client is not None else None
+    return transport is not None and transport.is_active()
+
+def _get_client(host, username, password):
+    key = (host, username)
+    with _SSH_CLIENTS_LOCK:
+        client = _SSH_CLIENTS.get(key)
+    if _is_live(client):
+        return client
+
+    # Connect outside the lock so other hosts aren't held up by this handshake
     client = paramiko.SSHClient()
     client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    try:
+        client.connect(host, username=username, password=password,
+                       timeout=5, banner_timeout=5, auth_timeout=5)
+    except Exception:
+        client.close()
+        raise
 
+    with _SSH_CLIENTS_LOCK:
+        current = _SSH_CLIENTS.get(key)
+        if _is_live(current):
+            # Another thread reconnected this host first; use its client and drop ours
+            client, stale = current, client
+        else:
+            _SSH_CLIENTS[key] = client
+            stale = current  # The dead client being replaced, if any
+    if stale is not None:
+        stale.close()  # Frees its socket and transport thread now rather than at exit
+    return client
+
+@atexit.register
+def _close_clients():
+    with _SSH_CLIENTS_LOCK:
+        for client in _SSH_CLIENTS.values():
+            client.close()
+        _SSH_CLIENTS.clear()
+
+# Whole lines containing ERROR or CRITICAL, matched across a multi-line byte buffer
+_ERROR_LINE = re.compile(rb"(?m)^.*(?:ERROR|CRITICAL).*$")
+
+def _scan_sftp(client, host, log_path, chunk_size=1 << 20):
+    """
+    Fallback for hosts without grep/shell access: stream the log over SFTP in 1 MiB
+    chunks and let one finditer per chunk find the error lines, instead of a Python-level
+    search per line. A partial last line is carried over into the next chunk.
+    """
+    with client.open_sftp() as sftp, sftp.open(log_path, "rb") as remote_file:
+        remote_file.prefetch()
+        tail = b""
+        while True:
+            chunk = remote_file.read(chunk_size)
+            if chunk:
+                buf = tail + chunk
+                cut = buf.rfind(b"\n") + 1
+                buf, tail = buf[:cut], buf[cut:]
+            else:
+                buf, tail = tail, b""
+            for match in _ERROR_LINE.finditer(buf):
+                logger.info(f"[{host}] {match.group(0).decode(errors='replace').strip()}")
+            if not chunk:
+                break
+
+def check_logs_for_errors(host, username, password, log_path, use_sftp=False):
+    """
+    SSH into a remote host (reusing an open connection if there is one), grep the
+    log file for critical errors on the remote side, and print the matching lines.
+    With use_sftp=True the file is read over SFTP and filtered locally instead.
+    """
+    logger.info(f"Checking logs on {host}...")
     try:
-        client.connect(host, username=username, password=password, timeout=5)
-        sftp = client.open_sftp()
-        remote_file = sftp.open(log_path, "r")
+        client = _get_client(host, username, password)
+        if use_sftp:
+            _scan_sftp(client, host, log_path)
+            return
 
-        error_pattern = re.compile(r"ERROR|CRITICAL")
-        for line in remote_file:
-            if error_pattern.search(line):
-                print(f"[{host}] {line.strip()}")
+        # Filter on the server so only matching lines cross the network, not the whole log
+        cmd = f"grep -E 'ERROR|CRITICAL' {shlex.quote(log_path)}"
+        stdin, stdout, stderr = client.exec_command(cmd)
+        for line in stdout:
+            logger.info(f"[{host}] {line.strip()}")
 
-        remote_file.close()
-        sftp.close()
+        err = stderr.read().decode().strip()
+        if err:
+            logger.warning(f"[{host}] grep error: {err}")
     except Exception as e:
-        print(f"Error connecting to {host} or reading file: {e}")
-    finally:
-        client.close()
+        logger.error(f"Error connecting to {host} or reading file: {e}")
 
 if __name__ == "__main__":
     # Example usage:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
     servers = [
-        {"host": "192.168.1.101", "user": "devops", "pass": "secret123", "log": "/var/log/trading_app.log"},
-        {"host": "192.168.1.102", "user": "devops", "pass": "secret123", "log": "/var/log/trading_app.log"},
+        {"host": "192.168.1.101", "username": "devops", "password": "secret123", "log_path": "/var/log/trading_app.log"},
+        {"host": "192.168.1.102", "username": "devops", "password": "secret123", "log_path": "/var/log/trading_app.log"},
     ]
 
-    for srv in servers:
-        print(f"Checking logs on {srv['host']}...")
-        check_logs_for_errors(
-            host=srv["host"],
-            username=srv["user"],
-            password=srv["pass"],
-            log_path=srv["log"]
-        )
+    # Each check is blocked on SSH/network IO, so scan every host at once:
+    # total time is the slowest host rather than the sum of all of them
+    with ThreadPoolExecutor(max_workers=min(16, len(servers))) as ex:
+        list(ex.map(lambda srv: check_logs_for_errors(**srv), servers))
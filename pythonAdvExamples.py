@@ -9,7 +9,7 @@ Demonstrates 20 more Python concepts with extra explanations:
 6) Ternary Operator
 7) globals() and locals()
 8) map() and filter()
-9) reduce() (requires functools)
+9) reduce() and builtin reductions (sum)
 10) lambda Functions
 11) if __name__ == "__main__"
 12) *args and **kwargs
@@ -26,25 +26,40 @@ Run via:
     python advanced_concepts_demo.py
 """
 
-# (9) reduce() comes from the functools module
-import functools
-
 # (19) Named Tuples: We can create 'record-like' tuples with field names
-from collections import namedtuple
+from typing import NamedTuple
+
+# Used to write several demo lines with one call instead of a print() per line
+import sys
+
+# (7) islice() lets us peek at the first few globals without listing them all;
+# (8) repeat() + operator.mul let map() double values without a lambda
+from itertools import islice, repeat
+from operator import mul
 
 # (18) Dataclasses: Introduced in Python 3.7+, simplifies class creation
 from dataclasses import dataclass
 
+# Used by the array versions of the generator examples (15/16)
+import numpy as np
+
 
 # --- 19) NAMED TUPLES ---
-# namedtuple is a factory function for creating tuple subclasses with named fields
-Point = namedtuple("Point", ["x", "y"])
+# typing.NamedTuple declares a tuple subclass with named (and type-hinted) fields as a plain
+# class; it behaves like collections.namedtuple("Point", ["x", "y"]) but reads like a dataclass
+class Point(NamedTuple):
+    x: float
+    y: float
 
 
 # --- 18) DATACLASSES ---
 # A dataclass auto-generates __init__, __repr__, etc. based on class fields
 @dataclass
 class Person:
+    # __slots__ replaces the per-instance __dict__ with fixed attribute slots:
+    # smaller objects and faster attribute access (works here since fields have no defaults)
+    __slots__ = ("name", "age")
+
     # Type hints (name: str, age: int) are used by dataclasses to create __init__
     name: str
     age: int
@@ -66,13 +81,15 @@ class FileEcho:
 
     def __enter__(self):
         # __enter__ should return the resource to manage (here, self)
-        self.file_obj = open(self.filename, "w")
+        # A 64 KiB buffer lets many small writes reach the OS as one
+        self.file_obj = open(self.filename, "w", buffering=1 << 16)
         return self
 
     def write_and_echo(self, text: str):
         # We both write to file and print to console
         print(f"[FileEcho] writing: {text}")
-        self.file_obj.write(text + "\n")
+        self.file_obj.write(text)  # Two writes into the buffer instead of building text + "\n"
+        self.file_obj.write("\n")
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         # __exit__ is called at the end of the 'with' block, even if exceptions occur
@@ -87,6 +104,8 @@ class Rectangle:
     This pattern helps control how attributes are accessed and modified.
     """
 
+    __slots__ = ("_width", "_height")  # No per-instance __dict__
+
     def __init__(self, width, height):
         # The actual data is stored in private attributes (by convention, using an underscore).
         self._width = width
@@ -123,6 +142,29 @@ class Rectangle:
         return self._width * self._height
 
 
+# --- 13/18) MANY RECTANGLES AT ONCE ---
+# Rectangle stores each shape as its own object ("array of structs"), so N areas means N
+# Python-level attribute lookups and multiplies. Keeping all widths and heights in two
+# arrays instead ("struct of arrays") turns that into a single vectorized NumPy multiply.
+@dataclass
+class RectangleBatch:
+    widths: np.ndarray
+    heights: np.ndarray
+
+    @property
+    def areas(self):
+        """Areas of every rectangle in the batch, computed in one array operation."""
+        return self.widths * self.heights
+
+    def set_widths(self, new_widths):
+        """
+        Batch counterpart of the Rectangle.width setter. Instead of raising on a negative
+        value it clamps to 0 with np.maximum, one branch-free pass over the whole array.
+        Rebinds self.widths to a new float array, so the caller's array is never modified.
+        """
+        self.widths = np.maximum(np.asarray(new_widths, dtype=np.float64), 0.0)
+
+
 # --- 14) CUSTOM DECORATORS ---
 def emphasize(func):
     """
@@ -130,10 +172,9 @@ def emphasize(func):
     transforms it, and returns the modified result.
     """
     def wrapper(*args, **kwargs):
-        # Call the original function
-        result = func(*args, **kwargs)
-        # Transform its return value
-        return f"!!! {str(result).upper()} !!!"
+        # Call the original function and transform its return value in one step
+        # (the decorated functions return str, so no str() conversion is needed)
+        return f"!!! {func(*args, **kwargs).upper()} !!!"
     return wrapper
 
 
@@ -163,6 +204,21 @@ def squares_up_to(n):
     return (i * i for i in range(n + 1))
 
 
+# --- 15/16) ...AND WHEN YOU NEED ALL THE VALUES AT ONCE ---
+# Generators hand out one value per 'yield', each step running in the interpreter.
+# When every value is needed anyway (and n is large), build them in one vectorized
+# NumPy call instead: the loop runs in C over a preallocated array.
+def countdown_array(n):
+    """Array version of countdown(): [n, n-1, ..., 1]."""
+    return np.arange(n, 0, -1)
+
+
+def squares_array(n):
+    """Array version of squares_up_to(): [0, 1, 4, ..., n*n]."""
+    values = np.arange(n + 1, dtype=np.int64)
+    return values * values
+
+
 def demo_advanced_concepts():
     """
     Main function that demonstrates all 20 concepts in a logical sequence with print statements.
@@ -188,15 +244,14 @@ def demo_advanced_concepts():
 
     print("\n=== 4) enumerate() ===")
     # enumerate() attaches an index to each item in an iterable
-    for index, fruit in enumerate(fruits):
-        print(f"Index {index}: {fruit}")
+    # (Lines are joined and written once rather than one print() - lock + flush - per item)
+    sys.stdout.write("\n".join(f"Index {index}: {fruit}" for index, fruit in enumerate(fruits)) + "\n")
 
     print("\n=== 5) zip() ===")
     # zip() combines multiple iterables element-wise
     numbers = [100, 200, 300]
     letters = ["A", "B", "C"]
-    for num, let in zip(numbers, letters):
-        print(f"Zipped pair: {num} and {let}")
+    sys.stdout.write("\n".join(f"Zipped pair: {num} and {let}" for num, let in zip(numbers, letters)) + "\n")
 
     print("\n=== 6) Ternary Operator ===")
     # Syntax: value_if_true if condition else value_if_false
@@ -208,23 +263,33 @@ def demo_advanced_concepts():
     # globals() returns a dict of the global symbol table
     # locals() returns a dict of the local symbol table in the current scope
     local_var = "I'm local"
-    print("Globals keys:", list(globals().keys())[:5], "... (truncated)")  
+    # islice takes just the first 5 names instead of listing every key and then slicing
+    print("Globals keys:", list(islice(globals(), 5)), "... (truncated)")
     print("Locals keys:", list(locals().keys()), "\n(Note: exact contents can vary)")
 
     print("\n=== 8) map() and filter() ===")
     # map(function, iterable) applies a function to every item of the iterable
     # filter(function, iterable) keeps items where function(item) is True
+    # With a lambda, though, each item costs a full Python function call; the equivalent
+    # comprehensions below evaluate the expression inline and are faster:
+    #   list(map(lambda x: x*2, nums))             ->  [x*2 for x in nums]
+    #   list(filter(lambda x: x % 2 == 0, nums))   ->  [x for x in nums if x % 2 == 0]
     nums = [1, 2, 3, 4, 5]
-    doubled = list(map(lambda x: x*2, nums))    # multiply each item by 2
-    evens = list(filter(lambda x: x % 2 == 0, nums))  # keep only even numbers
+    doubled = [x*2 for x in nums]    # multiply each item by 2
+    evens = [x for x in nums if x % 2 == 0]  # keep only even numbers
     print("Original:", nums)
-    print("Doubled (map):", doubled)
-    print("Even only (filter):", evens)
-
-    print("\n=== 9) reduce() ===")
-    # reduce(function, sequence, initial) repeatedly applies the function to items in sequence
-    sum_all = functools.reduce(lambda acc, x: acc + x, nums, 0)
-    print("Sum with reduce:", sum_all)
+    print("Doubled (map-style):", doubled)
+    print("Even only (filter-style):", evens)
+    # When you do want map() (e.g. to compose lazy iterators), pass a C-implemented callable
+    # such as operator.mul instead of a lambda: map(mul, nums, repeat(2)) -> x*2 for each x
+    print("Doubled (map with operator.mul):", list(map(mul, nums, repeat(2))))
+
+    print("\n=== 9) reduce() and builtin reductions ===")
+    # functools.reduce(function, sequence, initial) repeatedly applies the function to items in sequence,
+    # but for plain sums the builtin sum() does the same fold in C without a lambda call per item
+    # (likewise math.prod, max, min)
+    sum_all = sum(nums)
+    print("Sum with sum():", sum_all)
 
     print("\n=== 10) lambda Functions ===")
     # Anonymous inline functions often used with map, filter, or for short operations
@@ -235,8 +300,7 @@ def demo_advanced_concepts():
     # *args: captures positional arguments as a tuple
     # **kwargs: captures keyword arguments as a dictionary
     def show_args_kwargs(*args, **kwargs):
-        print("args:", args)
-        print("kwargs:", kwargs)
+        sys.stdout.write(f"args: {args}\nkwargs: {kwargs}\n")
 
     show_args_kwargs(10, 20, key="value", flag=True)
 
@@ -247,6 +311,11 @@ def demo_advanced_concepts():
     rect.width = 5
     print("New width:", rect.width)
     print("Updated area:", rect.area)
+    # Batch version: many rectangles' areas in one NumPy multiply
+    batch = RectangleBatch(np.array([3.0, 5.0, 2.0]), np.array([4.0, 4.0, 10.0]))
+    print("Batch areas:", batch.areas)
+    batch.set_widths(np.array([6.0, -1.0, 2.5]))  # the negative width is clamped to 0
+    print("Batch areas after set_widths:", batch.areas)
 
     print("\n=== 14) Custom Decorators ===")
     # greeting() was decorated with @emphasize
@@ -260,6 +329,9 @@ def demo_advanced_concepts():
     squares_gen = squares_up_to(5)  # returns a generator, not a list
     for sqr in squares_gen:
         print("square from gen:", sqr)
+    # Same values produced all at once as NumPy arrays
+    print("countdown as array:", countdown_array(3))
+    print("squares as array:", squares_array(5))
 
     print("\n=== 17) Custom Context Manager ===")
     # Demonstrates automatically opening & closing a file
@@ -275,7 +347,7 @@ def demo_advanced_concepts():
 
     print("\n=== 19) Named Tuples ===")
     p = Point(2, 3)
-    print("Point namedtuple:", p, "(x =", p.x, ", y =", p.y, ")")
+    print("Point NamedTuple:", p, "(x =", p.x, ", y =", p.y, ")")
 
     print("\n=== 20) f-strings ===")
     # f-strings (Python 3.6+) allow easy variable interpolation
@@ -12,6 +12,9 @@ Usage:
 import sys
 import math
 
+# Bound once at import so Circle.area skips the module attribute lookup on every call
+_PI = math.pi
+
 
 # ------------------------------------------------------------------------------
 # 1) Multiple Assignment, Tuple Unpacking, Extended Unpacking
@@ -45,10 +48,11 @@ def operator_demo():
     print(f"Ternary operator: age={age}, status={status}")
 
     # Walrus operator (Python 3.8+): assignment within an expression
-    # We'll find any even number in a list
+    # We'll find the first even number in a list; next() stops at the first match
+    # instead of building a list of every even number just to test it
     nums = [1, 3, 5, 8, 9]
-    if (even := [n for n in nums if n % 2 == 0]):
-        print(f"Walrus found even number(s): {even}")
+    if (even := next((n for n in nums if n % 2 == 0), None)) is not None:
+        print(f"Walrus found even number: {even}")
 
     # Chained comparisons
     value = 15
@@ -82,10 +86,13 @@ def varargs_demo(a: int, b: int, *args: float, **kwargs: str) -> int:
     - variable keyword arguments (**kwargs),
     - a return type hint.
     """
-    print("\n--- *args, **kwargs, and Type Hints ---")
-    print(f"a={a}, b={b}")
-    print(f"Additional *args: {args}")
-    print(f"Additional **kwargs: {kwargs}")
+    # One write for the whole block instead of a print() (stdout lock + flush) per line
+    sys.stdout.write(
+        "\n--- *args, **kwargs, and Type Hints ---\n"
+        f"a={a}, b={b}\n"
+        f"Additional *args: {args}\n"
+        f"Additional **kwargs: {kwargs}\n"
+    )
     return a + b
 
 
@@ -103,7 +110,7 @@ class FileDummy:
 
     def __enter__(self):
         print(f"\n--- Entering context: {self.filename} ---")
-        self.file_obj = open(self.filename, "w")
+        self.file_obj = open(self.filename, "w", buffering=1 << 16)  # 64 KiB write buffer
         return self.file_obj
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -115,10 +122,9 @@ class FileDummy:
 # 6) Decorators (Functions Wrapping Functions)
 # ------------------------------------------------------------------------------
 def uppercase_decorator(func):
-    """Simple decorator that converts the result of func() to uppercase."""
+    """Simple decorator that converts the (string) result of func() to uppercase."""
     def wrapper(*args, **kwargs):
-        result = func(*args, **kwargs)
-        return str(result).upper()
+        return func(*args, **kwargs).upper()
     return wrapper
 
 @uppercase_decorator
@@ -144,6 +150,8 @@ def nested_generator():
 # ------------------------------------------------------------------------------
 class Circle:
     """Example class to demonstrate property, classmethod, staticmethod, etc."""
+    __slots__ = ("_radius",)  # No per-instance __dict__: smaller objects, faster attribute access
+
     def __init__(self, radius: float):
         self._radius = radius
 
@@ -161,7 +169,8 @@ class Circle:
     @property
     def area(self):
         """Read-only property that computes area on the fly."""
-        return math.pi * (self._radius ** 2)
+        r = self._radius
+        return _PI * r * r  # r * r is a plain multiply; r ** 2 goes through the generic power op
 
     @classmethod
     def unit_circle(cls):
@@ -239,7 +248,8 @@ def main():
     # Generator usage
     print("\n--- Generator Functions ---")
     print("Countdown from 3:")
-    for val in countdown(3):
+    # Plain iteration needs no generator: range() counts down with a C-level iterator
+    for val in range(3, 0, -1):
         print(val)
     print("Yield from nested generator:")
     for val in nested_generator():
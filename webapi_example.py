@@ -7,6 +7,13 @@ bash
 
 uvicorn 3_web_api_example:app --reload
 
+For production, run on uvloop (libuv event loop) and httptools (C HTTP parser) instead of
+the default asyncio loop and pure-Python h11 - same code, roughly 2-3x the requests/second:
+bash
+
+pip install uvloop httptools
+uvicorn webapi_example:app --loop uvloop --http httptools --workers 4 --no-access-log
+
 
 Go to http://127.0.0.1:8000/stock/AAPL in your browser or via curl to see JSON output like:
 json
@@ -21,26 +28,84 @@ Standard pattern for internal or external services in finance.
 Integrates well with front-end dashboards or other systems.
 '''
 
-from fastapi import FastAPI, HTTPException
-import yfinance as yf
+import re
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Response
+import httpx
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await _CLIENT.aclose()  # Release pooled connections when uvicorn stops or reloads
 
 app = FastAPI(
     title="Stock Price API",
     description="A simple FastAPI service to fetch the latest stock price from Yahoo Finance",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
+
+# One pooled client shared by every request, so TCP/TLS connections to Yahoo are reused.
+# Yahoo rejects requests without a browser-like User-Agent.
+_CLIENT = httpx.AsyncClient(timeout=5, headers={"User-Agent": "Mozilla/5.0"})
+
+# Responses are cached per minute under (ticker, minute bucket), already encoded as JSON
+# bytes so a cache hit does no serialization at all; entries from earlier minutes are
+# never asked for again and fall off the end of this small LRU
+CACHE_SECONDS = 60
+CACHE_SIZE = 1024
+_CACHE = OrderedDict()
+
+# The response shape never changes, so it is built by splicing bytes into a fixed template
+# rather than walking a dict through a JSON encoder. That is only safe because the ticker is
+# validated first: none of these characters need escaping inside a JSON string.
+TICKER_RE = re.compile(r"[A-Z0-9.\-^=]{1,15}")
+
+def _encode(ticker: str, last_close: float) -> bytes:
+    return b'{"ticker":"' + ticker.encode() + b'","last_close":' + f"{last_close:.2f}".encode() + b"}"
+
+async def _fetch(ticker: str):
+    """
+    Returns the last close for 'ticker' from Yahoo's chart JSON endpoint, or None if
+    Yahoo has no data for it. Parses the JSON directly - no pandas DataFrame involved.
+    """
+    resp = await _CLIENT.get(CHART_URL.format(ticker=ticker), params={"interval": "1d", "range": "1d"})
+    if resp.status_code == 404:
+        return None
+    resp.raise_for_status()
+    result = resp.json()["chart"]["result"]
+    if not result:
+        return None
+    closes = [c for c in result[0]["indicators"]["quote"][0].get("close", []) if c is not None]
+    return round(closes[-1], 2) if closes else None
+
 @app.get("/stock/{ticker}")
-def get_stock_price(ticker: str):
+async def get_stock_price(ticker: str):
     """
     Returns the current/last close price of the specified stock ticker.
     """
-    try:
-        data = yf.Ticker(ticker).history(period="1d")
-        if data.empty:
-            raise HTTPException(status_code=404, detail="No data found for that ticker.")
-
-        last_close = data["Close"].iloc[-1]
-        return {"ticker": ticker, "last_close": round(last_close, 2)}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    ticker = ticker.upper()
+    if not TICKER_RE.fullmatch(ticker):
+        raise HTTPException(status_code=400, detail="Invalid ticker symbol.")
+    key = (ticker, int(time.time() // CACHE_SECONDS))
+    if key in _CACHE:
+        _CACHE.move_to_end(key)
+        body = _CACHE[key]
+    else:
+        try:
+            last_close = await _fetch(ticker)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        body = None if last_close is None else _encode(ticker, last_close)
+        _CACHE[key] = body  # None is cached too, so unknown tickers stay cheap
+        if len(_CACHE) > CACHE_SIZE:
+            _CACHE.popitem(last=False)
+
+    if body is None:
+        raise HTTPException(status_code=404, detail="No data found for that ticker.")
+    return Response(content=body, media_type="application/json")